@@ -1,4 +1,23 @@
-from .api import conf_matrix, score, timeliness
+from .api import (
+    MultiMetricScorer,
+    conf_matrix,
+    report,
+    score,
+    score_arrays,
+    score_sweep,
+    timeliness,
+)
 from .scorer import ScoreCalculator, Timeliness, TimeSpaciness
 
-__all__ = ["conf_matrix", "score", "timeliness", "ScoreCalculator", "Timeliness", "TimeSpaciness"]
+__all__ = [
+    "conf_matrix",
+    "report",
+    "score",
+    "score_arrays",
+    "score_sweep",
+    "timeliness",
+    "MultiMetricScorer",
+    "ScoreCalculator",
+    "Timeliness",
+    "TimeSpaciness",
+]
@@ -0,0 +1,107 @@
+"""Compiled kernels for the hot loops of the scoring functions.
+
+``numba`` is an optional dependency. If it is not installed, equivalent NumPy
+implementations are used instead.
+"""
+from typing import Optional
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
+
+# NumPy implementations. They are used if numba is not installed, and tested either way.
+def _bincount_confusion(t: np.ndarray, p: np.ndarray, w: Optional[np.ndarray] = None):
+    # Index 2 * true + pred enumerates the cells in the order tn, fp, fn, tp.
+    idx = (t.view(np.uint8) << 1) | p.view(np.uint8)
+    return tuple(np.bincount(idx, weights=w, minlength=4))
+
+
+def _exceeds(p: np.ndarray, thresh: float) -> np.ndarray:
+    return p >= thresh if thresh == 1 else p > thresh
+
+
+def numpy_binary_confusion_unweighted(t: np.ndarray, p: np.ndarray) -> tuple[int, int, int, int]:
+    return _bincount_confusion(t, p)
+
+
+def numpy_binary_confusion_weighted(
+    t: np.ndarray, p: np.ndarray, w: np.ndarray
+) -> tuple[float, float, float, float]:
+    return _bincount_confusion(t, p, w)
+
+
+def numpy_thresholded_confusion(
+    p: np.ndarray, p_hat: np.ndarray, p_thresh: float, p_hat_thresh: float, w: np.ndarray
+) -> tuple[float, float, float, float]:
+    return _bincount_confusion(_exceeds(p, p_thresh), _exceeds(p_hat, p_hat_thresh), w)
+
+
+if numba is not None:
+
+    # Serial: the arrays per data label are small, and a parallel kernel must not be
+    # launched from several threads at once with numba's default threading layer.
+    @numba.njit(cache=True, nogil=True)
+    def binary_confusion_unweighted(t: np.ndarray, p: np.ndarray) -> tuple[int, int, int, int]:
+        tn = fp = fn = tp = 0
+        for i in range(t.size):
+            if t[i]:
+                if p[i]:
+                    tp += 1
+                else:
+                    fn += 1
+            elif p[i]:
+                fp += 1
+            else:
+                tn += 1
+        return tn, fp, fn, tp
+
+    # Serial and without fastmath: weights are summed in input order like np.bincount does,
+    # so weighted scores do not depend on the number of threads. Releasing the GIL lets
+    # data labels be counted concurrently.
+    @numba.njit(cache=True, nogil=True)
+    def binary_confusion_weighted(
+        t: np.ndarray, p: np.ndarray, w: np.ndarray
+    ) -> tuple[float, float, float, float]:
+        tn = fp = fn = tp = 0.0
+        for i in range(t.size):
+            if t[i]:
+                if p[i]:
+                    tp += w[i]
+                else:
+                    fn += w[i]
+            elif p[i]:
+                fp += w[i]
+            else:
+                tn += w[i]
+        return tn, fp, fn, tp
+
+    @numba.njit(cache=True, nogil=True)
+    def thresholded_confusion(
+        p: np.ndarray, p_hat: np.ndarray, p_thresh: float, p_hat_thresh: float, w: np.ndarray
+    ) -> tuple[float, float, float, float]:
+        tn = fp = fn = tp = 0.0
+        for i in range(p.size):
+            t = p[i] >= p_thresh if p_thresh == 1 else p[i] > p_thresh
+            if p_hat_thresh == 1:
+                pred = p_hat[i] >= p_hat_thresh
+            else:
+                pred = p_hat[i] > p_hat_thresh
+            if t:
+                if pred:
+                    tp += w[i]
+                else:
+                    fn += w[i]
+            elif pred:
+                fp += w[i]
+            else:
+                tn += w[i]
+        return tn, fp, fn, tp
+
+else:  # pragma: no cover
+    binary_confusion_unweighted = numpy_binary_confusion_unweighted
+    binary_confusion_weighted = numpy_binary_confusion_weighted
+    thresholded_confusion = numpy_thresholded_confusion
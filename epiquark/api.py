@@ -1,37 +1,71 @@
-from dataclasses import dataclass
-from typing import Optional, Union
+from typing import NamedTuple, Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
-import sklearn.metrics as sk_metrics
 
-from .scorer import ScoreCalculator, Timeliness
+from . import _kernels
+from .scorer import ScoreCalculator, Timeliness, _LabelArrays
 
 
-@dataclass
-class _ThreshRequired:
+def _thresh_bits(p_thresh, p_hat_thresh) -> int:
+    """Packs which thresholds are given into two bits: ``0b<p_thresh><p_hat_thresh>``."""
+    return (p_thresh is not None) << 1 | (p_hat_thresh is not None)
+
+
+_THRESH_ERRORS = {
+    0b11: "This metric requires p_thresh and requires p_hat_thresh.",
+    0b10: "This metric requires p_thresh and must not contain p_hat_thresh.",
+    0b01: "This metric must not contain p_thresh and requires p_hat_thresh.",
+    0b00: "This metric must not contain p_thresh and must not contain p_hat_thresh.",
+}
+
+
+class _ThreshRequired(NamedTuple):
     p_thresh: bool
     p_hat_thresh: bool
 
+    @property
+    def packed(self) -> int:
+        """Required thresholds packed like :func:`_thresh_bits`."""
+        return self.p_thresh << 1 | self.p_hat_thresh
+
     def check_threshs_correct(
         self, p_thresh: Optional[float], p_hat_thresh: Optional[float]
     ) -> None:
-        actual = (p_thresh is not None, p_hat_thresh is not None)
-        threshs_correct = actual == (self.p_thresh, self.p_hat_thresh)
-        if not threshs_correct:
-            raise ValueError(
-                (
-                    f"This metric {self._thresh_text(self.p_thresh)} p_thresh "
-                    f"and {self._thresh_text(self.p_hat_thresh)} p_hat_thresh."
-                )
-            )
-
-    def _thresh_text(self, thresh: bool):
-        if thresh:
-            thresh_text = "requires"
-        else:
-            thresh_text = "must not contain"
-        return thresh_text
+        _check_thresh_bits(self.packed, p_thresh, p_hat_thresh)
+
+
+def _check_thresh_bits(
+    required: int, p_thresh: Optional[float], p_hat_thresh: Optional[float]
+) -> None:
+    # Only compares two ints on success; the error message is precomputed.
+    if _thresh_bits(p_thresh, p_hat_thresh) != required:
+        raise ValueError(_THRESH_ERRORS[required])
+
+
+_BOTH_THRESHS = _ThreshRequired(p_thresh=True, p_hat_thresh=True)
+_P_THRESH_ONLY = _ThreshRequired(p_thresh=True, p_hat_thresh=False)
+_NO_THRESHS = _ThreshRequired(p_thresh=False, p_hat_thresh=False)
+
+_THRESHS_REQUIRED = {
+    "f1": _BOTH_THRESHS,
+    "brier": _P_THRESH_ONLY,
+    "auc": _P_THRESH_ONLY,
+    "sensitivity": _BOTH_THRESHS,
+    "recall": _BOTH_THRESHS,
+    "tpr": _BOTH_THRESHS,
+    "specificity": _BOTH_THRESHS,
+    "tnr": _BOTH_THRESHS,
+    "fpr": _BOTH_THRESHS,
+    "fnr": _BOTH_THRESHS,
+    "precision": _BOTH_THRESHS,
+    "ppv": _BOTH_THRESHS,
+    "npv": _BOTH_THRESHS,
+    "matthews": _BOTH_THRESHS,
+    "r2": _NO_THRESHS,
+    "mse": _NO_THRESHS,
+    "mae": _NO_THRESHS,
+}
 
 
 def score(
@@ -43,6 +77,7 @@ def score(
     weighting: Optional[Union[str, np.ndarray]] = None,
     time_space_weighting: dict[str, float] = None,
     time_axis: Optional[str] = None,
+    validate: bool = True,
 ):
     r"""Calculates epidemiologically meaningful scores.
 
@@ -109,34 +144,17 @@ def score(
                               Gaussian as values.
         time_axis: Only valid if weight is 'timespace'. Assigns over which coordinates
                    temporal weighting should happen.
+        validate: If False, ``cases`` and ``signals`` are not checked for correctness.
+                  Only use this for data that is known to be valid, e.g., because
+                  it was checked before.
 
     Returns:
         Scores per ``data_label``.
     """
-    _check_threshs(metric, threshold_true, threshold_pred)
-    metrics = {
-        "f1": sk_metrics.f1_score,
-        "brier": sk_metrics.brier_score_loss,
-        "auc": _auc,
-        "sensitivity": _sensitivity,
-        "recall": _sensitivity,
-        "tpr": _sensitivity,
-        "specificity": _specificity,
-        "tnr": _specificity,
-        "fpr": _fpr,
-        "fnr": _fnr,
-        "precision": _precision,
-        "ppv": _precision,
-        "npv": _npv,
-        "matthews": sk_metrics.matthews_corrcoef,
-        "r2": sk_metrics.r2_score,
-        "mse": sk_metrics.mean_squared_error,
-        "mae": sk_metrics.mean_absolute_error,
-    }
-    return ScoreCalculator(cases, signals).calc_score(
-        scorer=metrics[metric],
-        p_thresh=threshold_true,
-        p_hat_thresh=threshold_pred,
+    return MultiMetricScorer(cases, signals, validate=validate).score(
+        metric,
+        threshold_true=threshold_true,
+        threshold_pred=threshold_pred,
         weighting=weighting,
         time_space_weighting=time_space_weighting,
         time_axis=time_axis,
@@ -146,71 +164,265 @@ def score(
 def _check_threshs(
     metric: str, p_thresh: Optional[float] = None, p_hat_thresh: Optional[float] = None
 ):
-    required_treshs = {
-        "f1": _ThreshRequired(p_thresh=True, p_hat_thresh=True),
-        "brier": _ThreshRequired(p_thresh=True, p_hat_thresh=False),
-        "auc": _ThreshRequired(p_thresh=True, p_hat_thresh=False),
-        "sensitivity": _ThreshRequired(p_thresh=True, p_hat_thresh=True),
-        "recall": _ThreshRequired(p_thresh=True, p_hat_thresh=True),
-        "tpr": _ThreshRequired(p_thresh=True, p_hat_thresh=True),
-        "specificity": _ThreshRequired(p_thresh=True, p_hat_thresh=True),
-        "tnr": _ThreshRequired(p_thresh=True, p_hat_thresh=True),
-        "fpr": _ThreshRequired(p_thresh=True, p_hat_thresh=True),
-        "fnr": _ThreshRequired(p_thresh=True, p_hat_thresh=True),
-        "precision": _ThreshRequired(p_thresh=True, p_hat_thresh=True),
-        "ppv": _ThreshRequired(p_thresh=True, p_hat_thresh=True),
-        "npv": _ThreshRequired(p_thresh=True, p_hat_thresh=True),
-        "matthews": _ThreshRequired(p_thresh=True, p_hat_thresh=True),
-        "r2": _ThreshRequired(p_thresh=False, p_hat_thresh=False),
-        "mse": _ThreshRequired(p_thresh=False, p_hat_thresh=False),
-        "mae": _ThreshRequired(p_thresh=False, p_hat_thresh=False),
-    }
-    try:
-        required_tresh = required_treshs[metric]
-    except KeyError:
+    required = _THRESHS_REQUIRED.get(metric)
+    if required is None:
         raise KeyError(
             (
                 "This metric is not recognized. "
-                f"Please use one of the following: {', '.join(required_treshs.keys())}"
+                f"Please use one of the following: {', '.join(_THRESHS_REQUIRED.keys())}"
             )
         )
+    required.check_threshs_correct(p_thresh, p_hat_thresh)
 
-    required_tresh.check_threshs_correct(p_thresh=p_thresh, p_hat_thresh=p_hat_thresh)
 
+def _binary_confusion(true, pred, sample_weight=None):
+    """Counts the cells of a binary confusion matrix in a single pass over the data.
+
+    Returns:
+        ``tn, fp, fn, tp`` in the same order as ``confusion_matrix(...).ravel()``.
+    """
+    t = _as_bool(true)
+    p = _as_bool(pred)
+    if sample_weight is None:
+        cells = _kernels.binary_confusion_unweighted(t, p)
+        return tuple(np.array(cells, dtype=np.int64))
+    w = np.ascontiguousarray(sample_weight, dtype=np.float64)
+    cells = _kernels.binary_confusion_weighted(t, p, w)
+    return tuple(np.array(cells, dtype=np.float64))
+
+
+def _thresholded_conf(p, p_hat, p_thresh, p_hat_thresh, sample_weight):
+    """Binarizes ``p`` and ``p_hat`` and counts the confusion cells in one pass over the data.
+
+    Binarization follows :meth:`ScoreCalculator._thresholded_eval_df`: values must be larger
+    than the threshold, or equal if the threshold is one. A missing or zero threshold keeps
+    the probabilities, which as labels is the same as being larger than zero.
+
+    Returns:
+        ``tn, fp, fn, tp`` in the same order as ``confusion_matrix(...).ravel()``.
+    """
+    cells = _kernels.thresholded_confusion(
+        np.ascontiguousarray(p, dtype=np.float64),
+        np.ascontiguousarray(p_hat, dtype=np.float64),
+        float(p_thresh or 0),
+        float(p_hat_thresh or 0),
+        np.ascontiguousarray(sample_weight, dtype=np.float64),
+    )
+    return tuple(np.array(cells, dtype=np.float64))
 
-def _sensitivity(true, pred, sample_weight):
-    tn, fp, fn, tp = sk_metrics.confusion_matrix(true, pred, sample_weight=sample_weight).ravel()
-    return tp / (tp + fn)
 
+def _conf_matrix(p, p_hat, p_thresh, p_hat_thresh, sample_weight) -> np.ndarray:
+    """Binarizes ``p`` and ``p_hat`` and builds ``confusion_matrix(..., labels=[0, 1])``.
 
-def _specificity(true, pred, sample_weight):
-    tn, fp, fn, tp = sk_metrics.confusion_matrix(true, pred, sample_weight=sample_weight).ravel()
-    return tn / (tn + fp)
+    Unlike sklearn without ``labels``, the matrix is 2x2 also if only one class occurs.
+    Integer weights give integer counts, as in sklearn.
+    """
+    tn, fp, fn, tp = _thresholded_conf(p, p_hat, p_thresh, p_hat_thresh, sample_weight)
+    dtype = np.int64 if np.asarray(sample_weight).dtype.kind in "iub" else np.float64
+    return np.array([[tn, fp], [fn, tp]], dtype=dtype)
 
 
-def _fpr(true, pred, sample_weight):
-    tn, fp, fn, tp = sk_metrics.confusion_matrix(true, pred, sample_weight=sample_weight).ravel()
-    return fp / (fp + tn)
+def _ratio(numerator, denominator):
+    """Divides confusion cells, scalars or arrays. Empty denominators give NaN without warning."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.true_divide(numerator, denominator)
 
 
-def _fnr(true, pred, sample_weight):
-    tn, fp, fn, tp = sk_metrics.confusion_matrix(true, pred, sample_weight=sample_weight).ravel()
-    return fn / (fn + tp)
+_CONFUSION_RATES = {
+    "sensitivity": lambda tn, fp, fn, tp: _ratio(tp, tp + fn),
+    "specificity": lambda tn, fp, fn, tp: _ratio(tn, tn + fp),
+    "fpr": lambda tn, fp, fn, tp: _ratio(fp, fp + tn),
+    "fnr": lambda tn, fp, fn, tp: _ratio(fn, fn + tp),
+    "precision": lambda tn, fp, fn, tp: _ratio(tp, tp + fp),
+    "npv": lambda tn, fp, fn, tp: _ratio(tn, tn + fn),
+}
+_CONFUSION_RATES.update(
+    recall=_CONFUSION_RATES["sensitivity"],
+    tpr=_CONFUSION_RATES["sensitivity"],
+    tnr=_CONFUSION_RATES["specificity"],
+    ppv=_CONFUSION_RATES["precision"],
+)
 
 
 def _auc(true, pred, sample_weight):
-    fpr, tpr, _ = sk_metrics.roc_curve(true, pred, sample_weight=sample_weight)
-    return sk_metrics.auc(fpr, tpr)
+    """Area under the ROC curve without building the curve through sklearn.
+
+    Walks the predictions from the highest to the lowest score once and integrates the
+    true positive rate over the false positive rate with the trapezoidal rule. Tied
+    predictions form one step, so they count half as in the Mann-Whitney U statistic.
+
+    Without weights, the result is identical to sklearn's ``roc_curve`` + ``auc``. With
+    weights, it can differ from sklearn in the last digit.
+    """
+    score = np.asarray(pred)
+    order = np.argsort(score, kind="mergesort")[::-1]
+    score = score[order]
+    y = _as_bool(true)[order]
+    if sample_weight is None:
+        w = np.ones(y.size)
+    else:
+        w = np.asarray(sample_weight, dtype=np.float64)[order]
+
+    tie_ends = np.r_[np.flatnonzero(np.diff(score)), y.size - 1]
+    tps = np.cumsum(np.where(y, w, 0))[tie_ends]
+    fps = np.cumsum(np.where(y, 0, w))[tie_ends]
+    # Collinear points do not change the area but dropping them keeps results identical
+    # to sklearn's roc_curve + auc.
+    if fps.size > 2:
+        corners = np.r_[True, np.diff(fps, 2).astype(bool) | np.diff(tps, 2).astype(bool), True]
+        tps = tps[corners]
+        fps = fps[corners]
+    tps = np.r_[0, tps]
+    fps = np.r_[0, fps]
+    if tps[-1] == 0 or fps[-1] == 0:
+        return np.nan
+    tpr = tps / tps[-1]
+    fpr = fps / fps[-1]
+    return (np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2).sum()
+
+
+def _f1(true, pred, sample_weight):
+    t = _as_bool(true)
+    p = _as_bool(pred)
+    # Same sums, operations, and zero division handling as sklearn's f1_score. With weights,
+    # the cells from _binary_confusion can round differently.
+    tp = np.bincount(t & p, weights=sample_weight, minlength=2)[1]
+    fp = np.bincount(p, weights=sample_weight, minlength=2)[1] - tp
+    fn = np.bincount(t, weights=sample_weight, minlength=2)[1] - tp
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    if not precision + recall:
+        return 0.0
+    return 2 * precision * recall / (precision + recall)
+
+
+def _matthews(true, pred, sample_weight):
+    tn, fp, fn, tp = np.array(_binary_confusion(true, pred, sample_weight), dtype=np.float64)
+    t_sum = np.array([tn + fp, fn + tp])
+    p_sum = np.array([tn + fn, fp + tp])
+    n_samples = p_sum.sum()
+    cov_ytyp = (tn + tp) * n_samples - np.dot(t_sum, p_sum)
+    cov_ypyp = n_samples**2 - np.dot(p_sum, p_sum)
+    cov_ytyt = n_samples**2 - np.dot(t_sum, t_sum)
+    if cov_ypyp * cov_ytyt == 0:
+        return 0.0
+    return cov_ytyp / np.sqrt(cov_ytyt * cov_ypyp)
+
+
+def _brier(true, pred, sample_weight):
+    # uint8 labels would wrap around on subtraction.
+    errors = np.asarray(true, dtype=np.float64) - np.asarray(pred, dtype=np.float64)
+    return np.average(errors**2, weights=sample_weight)
+
+
+def _mse(true, pred, sample_weight):
+    return _column_average(
+        (np.asarray(true, dtype=np.float64) - np.asarray(pred, dtype=np.float64)) ** 2,
+        sample_weight,
+    )
+
+
+def _mae(true, pred, sample_weight):
+    return _column_average(
+        np.abs(np.asarray(pred, dtype=np.float64) - np.asarray(true, dtype=np.float64)),
+        sample_weight,
+    )
+
+
+def _r2(true, pred, sample_weight):
+    true = np.asarray(true, dtype=np.float64)[:, None]
+    pred = np.asarray(pred, dtype=np.float64)[:, None]
+    if true.shape[0] < 2:
+        return np.nan
+    weight = 1.0 if sample_weight is None else np.asarray(sample_weight)[:, None]
+    numerator = (weight * (true - pred) ** 2).sum(axis=0, dtype=np.float64)[0]
+    true_mean = np.average(true, axis=0, weights=sample_weight)
+    denominator = (weight * (true - true_mean) ** 2).sum(axis=0, dtype=np.float64)[0]
+    if not numerator:
+        return 1.0
+    if not denominator:
+        return 0.0
+    return 1 - numerator / denominator
+
+
+def _column_average(errors: np.ndarray, sample_weight) -> float:
+    """Averages ``errors`` as a column like sklearn's regression metrics do.
+
+    Summing along the first axis of a 2-D array keeps the summation order, and thus
+    the floats, of sklearn's ``mean_squared_error`` and ``mean_absolute_error``.
+    """
+    return np.average(errors[:, None], axis=0, weights=sample_weight)[0]
+
+
+# Metrics on binarized arrays. The rates of _CONFUSION_RATES binarize and count in one pass.
+_METRICS = {
+    "f1": _f1,
+    "brier": _brier,
+    "auc": _auc,
+    "matthews": _matthews,
+    "r2": _r2,
+    "mse": _mse,
+    "mae": _mae,
+}
+
+
+def score_arrays(
+    p_true: np.ndarray,
+    p_pred: np.ndarray,
+    metric: str,
+    *,
+    p_thresh: Optional[float] = None,
+    p_hat_thresh: Optional[float] = None,
+    sample_weight: Optional[np.ndarray] = None,
+) -> float:
+    r"""Calculates a score of already evaluated probabilities.
+
+    This is the fast path of :func:`score` for a single ``data_label``: no DataFrames are
+    built, the arrays are binarized once and handed to the metric directly.
 
+    Args:
+        p_true: 1-D array with :math:`p(d_i|x)` per cell.
+        p_pred: 1-D array with :math:`\hat{p}(d_i|x)` per cell, in the same order as ``p_true``.
+        metric: Specifies metric to compare ``p_true`` and ``p_pred``. See :func:`score` for
+                possible options.
+        p_thresh: To binarize ``p_true``. See ``threshold_true`` of :func:`score`.
+        p_hat_thresh: To binarize ``p_pred``. See ``threshold_pred`` of :func:`score`.
+        sample_weight: 1-D array with weight per cell. If None, all cells weigh the same.
+
+    Returns:
+        Score of ``p_true`` and ``p_pred``.
+    """
+    _check_threshs(metric, p_thresh, p_hat_thresh)
+    return _score_arrays(
+        np.asarray(p_true), np.asarray(p_pred), metric, p_thresh, p_hat_thresh, sample_weight
+    )
 
-def _precision(true, pred, sample_weight):
-    tn, fp, fn, tp = sk_metrics.confusion_matrix(true, pred, sample_weight=sample_weight).ravel()
-    return tp / (tp + fp)
 
+def _score_arrays(p_true, p_pred, metric, p_thresh, p_hat_thresh, sample_weight):
+    rate = _CONFUSION_RATES.get(metric)
+    if rate is not None:
+        # Binarize and count in one pass instead of thresholding the arrays first.
+        if sample_weight is None:
+            sample_weight = np.ones(len(p_true))
+        return rate(*_thresholded_conf(p_true, p_pred, p_thresh, p_hat_thresh, sample_weight))
+    return _METRICS[metric](
+        _threshold(p_true, p_thresh), _threshold(p_pred, p_hat_thresh), sample_weight
+    )
+
+
+def _threshold(p: np.ndarray, thresh: Optional[float]) -> np.ndarray:
+    """Binarizes ``p`` like :meth:`ScoreCalculator._thresholded_eval_df` does."""
+    if not thresh:
+        return p
+    return (p >= thresh if thresh == 1 else p > thresh).view(np.uint8)
 
-def _npv(true, pred, sample_weight):
-    tn, fp, fn, tp = sk_metrics.confusion_matrix(true, pred, sample_weight=sample_weight).ravel()
-    return tn / (tn + fn)
+
+def _as_bool(labels) -> np.ndarray:
+    """Binary labels as a contiguous bool array. Binarized uint8 labels are viewed, not copied."""
+    labels = np.ascontiguousarray(labels)
+    if labels.dtype == np.uint8:
+        return labels.view(np.bool_)
+    return labels.astype(np.bool_, copy=False)
 
 
 def conf_matrix(
@@ -221,6 +433,7 @@ def conf_matrix(
     weighting: Optional[Union[str, np.ndarray]] = None,
     time_space_weighting: dict[str, float] = None,
     time_axis: Optional[str] = None,
+    validate: bool = True,
 ) -> dict[str, np.ndarray]:
     r"""Calculate epidemiologically meaningful confusion matrices.
 
@@ -263,25 +476,189 @@ def conf_matrix(
                               Gaussian as values.
         time_axis: Only valid if weight is 'timespace'. Assigns over which coordinates
                    temporal weighting should happen.
+        validate: If False, ``cases`` and ``signals`` are not checked for correctness.
+                  Only use this for data that is known to be valid, e.g., because
+                  it was checked before.
 
     Returns:
-        Confusion matrix per data label.
+        Confusion matrix ``[[tn, fp], [fn, tp]]`` per data label. It is always 2x2,
+        even if a data label has only positive or only negative cells.
     """
-    if threshold_true is None:
-        threshold_true = 0
-    threshold_pred = threshold_pred or 0.5
-    return ScoreCalculator(cases, signals).calc_score(
-        scorer=sk_metrics.confusion_matrix,
-        p_thresh=threshold_true,
-        p_hat_thresh=threshold_pred,
+    return MultiMetricScorer(cases, signals, validate=validate).conf_matrix(
+        threshold_true=threshold_true,
+        threshold_pred=threshold_pred,
         weighting=weighting,
         time_space_weighting=time_space_weighting,
         time_axis=time_axis,
     )
 
 
+def score_sweep(
+    cases: pd.DataFrame,
+    signals: pd.DataFrame,
+    metric: str,
+    thresholds_true: Sequence[float],
+    thresholds_pred: Sequence[float],
+    weighting: Optional[Union[str, np.ndarray]] = None,
+    time_space_weighting: dict[str, float] = None,
+    time_axis: Optional[str] = None,
+    validate: bool = True,
+) -> dict[str, np.ndarray]:
+    r"""Calculates a confusion-matrix-based score for many pairs of thresholds at once.
+
+    Equivalent to calling :func:`score` for every combination of ``thresholds_true`` and
+    ``thresholds_pred``, but :math:`p(d_i|x)` and :math:`\hat{p}(d_i|x)` are only
+    calculated once and the confusion matrices of all threshold pairs are counted together.
+    This is useful to draw ROC or precision-recall curves.
+
+    Args:
+        cases: This DataFrame must contain the following columns and no NaNs:
+
+            - ``data_label``. Is the class per outbreak. Must contain ``endemic``
+              and must not contain ``non-case``.
+            - ``value``. This is the amount of cases in the respective cell.
+              This value must be an positive integer.
+            - Each other column in the DataFrame is treated as a coordinate
+              where each row is one single cell. This coordinate system is
+              the evaluation resolution.
+
+        signals: This DataFrame must contain the following columns:
+
+            - ``signal_label``. Is the class per signal. Must contain ``endemic`` and
+              ``non-case``.
+            - ``value``. This is the signal strength :math:`w` and should be :math:`w \in [0,1]`
+            - Each other column in the DataFrame is treated as a coordinate
+              where each row is one single cell. Cases coordinates and cells
+              must be subset of cases coordinates and cells. Cells outside
+              the coordinate system of the cases DataFrame are ignored.
+
+        metric: Specifies metric to compare :math:`p(d_i|x)` and :math:`\hat{p}(d_i|x)`.
+        Possible options are:
+
+            - `'sensitivity'`
+            - `'recall'`
+            - `'tpr'` (true positive rate)
+            - `'specificity'`
+            - `'tnr'` (true negative rate)
+            - `'fpr'` (false positive rate)
+            - `'fnr'` (false negative rate)
+            - `'precision'`
+            - `'ppv'` (positive predictive value)
+            - `'npv'` (negative predictive value)
+        thresholds_true: Thresholds to binarize :math:`p(d_i|x)`, the true probability per
+                         disease given cell.
+        thresholds_pred: Thresholds to binarize :math:`\hat{p}(d_i|x)`, the predicted
+                         probability per disease given cell.
+        weighting: Assigns weight to :math:`p(d_i|x)` and :math:`\hat{p}(d_i|x)` by either
+                 'cases' or 'timespace'. If None, no weighting is applied. You can use
+                 a 1-D numpy array where each entry is the weighting per cell in the same
+                 order as the `cases` DataFrame.
+        time_space_weighting: Only valid if weight is 'timespace'. Dict with dimension of
+                              the case data over which space-weighting should be applied
+                              as keys.
+                              Weighting is controlled by covariance value of the n-dim
+                              Gaussian as values.
+        time_axis: Only valid if weight is 'timespace'. Assigns over which coordinates
+                   temporal weighting should happen.
+        validate: If False, ``cases`` and ``signals`` are not checked for correctness.
+                  Only use this for data that is known to be valid, e.g., because
+                  it was checked before.
+
+    Returns:
+        Scores per ``data_label`` as array of shape
+        ``(len(thresholds_true), len(thresholds_pred))``.
+    """
+    return MultiMetricScorer(cases, signals, validate=validate).score_sweep(
+        metric,
+        thresholds_true,
+        thresholds_pred,
+        weighting=weighting,
+        time_space_weighting=time_space_weighting,
+        time_axis=time_axis,
+    )
+
+
+def _binarize(p: np.ndarray, thresholds: Sequence[float]) -> np.ndarray:
+    """Binarizes ``p`` for every threshold in the same way as :func:`score`.
+
+    Returns:
+        Float array of shape ``(len(p), len(thresholds))``.
+    """
+    threshs = np.asarray(thresholds, dtype=np.float64)[None, :]
+    p = p[:, None]
+    return np.where(threshs == 1, p >= threshs, p > threshs).astype(np.float64)
+
+
+def report(
+    cases: pd.DataFrame,
+    signals: pd.DataFrame,
+    metrics: Sequence[str],
+    threshold_true: Optional[float] = None,
+    threshold_pred: Optional[float] = None,
+    weighting: Optional[Union[str, np.ndarray]] = None,
+    time_space_weighting: dict[str, float] = None,
+    time_axis: Optional[str] = None,
+    validate: bool = True,
+) -> dict[str, dict[str, float]]:
+    r"""Calculates several scores at once.
+
+    ``cases`` and ``signals`` are preprocessed and weighted only once for all metrics.
+
+    Args:
+        cases: Case DataFrame as described in :func:`score`.
+        signals: Signal DataFrame as described in :func:`score`.
+        metrics: Metrics as described in :func:`score`.
+        threshold_true: To binarize :math:`p(d_i|x)`. Only passed to metrics that require it.
+        threshold_pred: To binarize :math:`\hat{p}(d_i|x)`. Only passed to metrics that
+                        require it.
+        weighting: Weighting as described in :func:`score`.
+        time_space_weighting: Only valid if weight is 'timespace'. See :func:`score`.
+        time_axis: Only valid if weight is 'timespace'. See :func:`score`.
+        validate: If False, ``cases`` and ``signals`` are not checked for correctness.
+
+    Returns:
+        Scores per ``data_label`` per metric.
+    """
+    return MultiMetricScorer(cases, signals, validate=validate).report(
+        metrics,
+        threshold_true=threshold_true,
+        threshold_pred=threshold_pred,
+        weighting=weighting,
+        time_space_weighting=time_space_weighting,
+        time_axis=time_axis,
+    )
+
+
+def _weighting_key(
+    weighting: Optional[Union[str, np.ndarray]],
+    time_space_weighting: Optional[dict[str, float]],
+    time_axis: Optional[str],
+) -> Optional[tuple]:
+    """Hashable key of the weighting arguments.
+
+    None if they cannot be hashed, e.g., for array weightings. Those are not cached, so
+    that :meth:`ScoreCalculator._weighted_eval_df` still checks them.
+    """
+    if not (weighting is None or isinstance(weighting, str)):
+        return None
+    gauss_dims = None
+    if time_space_weighting is not None:
+        gauss_dims = tuple(sorted(time_space_weighting.items()))
+    key = (weighting, gauss_dims, time_axis)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 def timeliness(
-    cases: pd.DataFrame, signals: pd.DataFrame, time_axis: str, D: int, signal_threshold: float = 0
+    cases: pd.DataFrame,
+    signals: pd.DataFrame,
+    time_axis: str,
+    D: int,
+    signal_threshold: float = 0,
+    validate: bool = True,
 ) -> dict[str, float]:
     r"""Calculates the timeliness of the detection of outbreaks.
 
@@ -324,8 +701,173 @@ def timeliness(
            the outbreak started, then the timeliness is :math:`0` for that data label.
         signal_threshold: Indicates at which threshold a generated signal is counted as one.
                           Binarized signal is used to quantify timeliness.
+        validate: If False, ``cases`` and ``signals`` are not checked for correctness.
+                  Only use this for data that is known to be valid, e.g., because
+                  it was checked before.
 
     Returns:
         Timeliness score per data label.
     """
-    return Timeliness(cases, signals).timeliness(time_axis, D, signal_threshold)
+    return MultiMetricScorer(cases, signals, validate=validate).timeliness(
+        time_axis, D, signal_threshold
+    )
+
+
+class MultiMetricScorer:
+    """Scores one data set with several metrics.
+
+    :func:`score`, :func:`conf_matrix`, :func:`score_sweep`, and :func:`timeliness` check and
+    preprocess ``cases`` and ``signals`` on every call. A `MultiMetricScorer` does so only
+    once and shares the result across all its methods. Hence, ``cases`` and ``signals``
+    must not be changed after the `MultiMetricScorer` was built.
+    """
+
+    def __init__(self, cases: pd.DataFrame, signals: pd.DataFrame, validate: bool = True) -> None:
+        """Builds scorer given data.
+
+        Args:
+            cases: Case DataFrame as described in :func:`score`.
+            signals: Signal DataFrame as described in :func:`score`.
+            validate: If False, ``cases`` and ``signals`` are not checked for correctness.
+                      Only use this for data that is known to be valid.
+        """
+        self.cases = cases
+        self.signals = signals
+        self.validate = validate
+        self._score_calculator: Optional[ScoreCalculator] = None
+        self._timeliness: Optional[Timeliness] = None
+        self._eval_arrays_cache: dict[tuple, _LabelArrays] = {}
+        self._score_cache: dict[tuple, dict[str, float]] = {}
+
+    @property
+    def _calculator(self) -> ScoreCalculator:
+        if self._score_calculator is None:
+            self._score_calculator = ScoreCalculator(self.cases, self.signals, self.validate)
+        return self._score_calculator
+
+    def _eval_arrays(
+        self,
+        weighting: Optional[Union[str, np.ndarray]],
+        time_space_weighting: Optional[dict[str, float]],
+        time_axis: Optional[str],
+    ) -> _LabelArrays:
+        """Unthresholded ``p(d_i)``, ``p^(d_i)`` and weights per data label.
+
+        They only depend on the weighting, so they are built once per weighting and shared
+        by all metrics and thresholds.
+        """
+        key = _weighting_key(weighting, time_space_weighting, time_axis)
+        if key is None:
+            return self._calculator._label_arrays(
+                None, None, weighting, time_space_weighting, time_axis
+            )
+        if key not in self._eval_arrays_cache:
+            self._eval_arrays_cache[key] = self._calculator._label_arrays(
+                None, None, weighting, time_space_weighting, time_axis
+            )
+        return self._eval_arrays_cache[key]
+
+    def score(
+        self,
+        metric: str,
+        threshold_true: Optional[float] = None,
+        threshold_pred: Optional[float] = None,
+        weighting: Optional[Union[str, np.ndarray]] = None,
+        time_space_weighting: dict[str, float] = None,
+        time_axis: Optional[str] = None,
+    ):
+        """Calculates epidemiologically meaningful scores. See :func:`score`.
+
+        Scores are cached, so asking for the same score twice does not compute it again.
+        """
+        _check_threshs(metric, threshold_true, threshold_pred)
+        weighting_key = _weighting_key(weighting, time_space_weighting, time_axis)
+        key = (metric, threshold_true, threshold_pred, weighting_key)
+        if weighting_key is None or key not in self._score_cache:
+            eval_arrays = self._eval_arrays(weighting, time_space_weighting, time_axis)
+            scores = eval_arrays.map(
+                lambda p, p_hat, weight: _score_arrays(
+                    p, p_hat, metric, threshold_true, threshold_pred, weight
+                )
+            )
+            if weighting_key is None:
+                return scores
+            self._score_cache[key] = scores
+        return dict(self._score_cache[key])
+
+    def report(
+        self,
+        metrics: Sequence[str],
+        threshold_true: Optional[float] = None,
+        threshold_pred: Optional[float] = None,
+        weighting: Optional[Union[str, np.ndarray]] = None,
+        time_space_weighting: dict[str, float] = None,
+        time_axis: Optional[str] = None,
+    ) -> dict[str, dict[str, float]]:
+        """Calculates several scores at once. See :func:`report`."""
+        scores = {}
+        for metric in metrics:
+            required = _THRESHS_REQUIRED.get(metric, _BOTH_THRESHS)
+            scores[metric] = self.score(
+                metric,
+                threshold_true=threshold_true if required.p_thresh else None,
+                threshold_pred=threshold_pred if required.p_hat_thresh else None,
+                weighting=weighting,
+                time_space_weighting=time_space_weighting,
+                time_axis=time_axis,
+            )
+        return scores
+
+    def conf_matrix(
+        self,
+        threshold_true: Optional[float] = None,
+        threshold_pred: Optional[float] = None,
+        weighting: Optional[Union[str, np.ndarray]] = None,
+        time_space_weighting: dict[str, float] = None,
+        time_axis: Optional[str] = None,
+    ) -> dict[str, np.ndarray]:
+        """Calculates confusion matrices per data label. See :func:`conf_matrix`."""
+        if threshold_true is None:
+            threshold_true = 0
+        threshold_pred = threshold_pred or 0.5
+        eval_arrays = self._eval_arrays(weighting, time_space_weighting, time_axis)
+        return eval_arrays.map(
+            lambda p, p_hat, weight: _conf_matrix(p, p_hat, threshold_true, threshold_pred, weight)
+        )
+
+    def score_sweep(
+        self,
+        metric: str,
+        thresholds_true: Sequence[float],
+        thresholds_pred: Sequence[float],
+        weighting: Optional[Union[str, np.ndarray]] = None,
+        time_space_weighting: dict[str, float] = None,
+        time_axis: Optional[str] = None,
+    ) -> dict[str, np.ndarray]:
+        """Calculates a score for many pairs of thresholds. See :func:`score_sweep`."""
+        rate = _CONFUSION_RATES.get(metric)
+        if rate is None:
+            raise KeyError(
+                (
+                    "This metric is not supported for threshold sweeps. "
+                    f"Please use one of the following: {', '.join(_CONFUSION_RATES.keys())}"
+                )
+            )
+        eval_arrays = self._eval_arrays(weighting, time_space_weighting, time_axis)
+        scores = {}
+        for d_i, p, p_hat, weight in eval_arrays:
+            true = _binarize(p, thresholds_true)
+            pred = _binarize(p_hat, thresholds_pred)
+            w = weight.astype(np.float64)
+            tp = (true * w[:, None]).T @ pred
+            fn = (w @ true)[:, None] - tp
+            fp = (w @ pred)[None, :] - tp
+            tn = w.sum() - tp - fn - fp
+            scores[d_i] = rate(tn, fp, fn, tp)
+        return scores
+
+    def timeliness(self, time_axis: str, D: int, signal_threshold: float = 0) -> dict[str, float]:
+        """Calculates the timeliness of the detection of outbreaks. See :func:`timeliness`."""
+        if self._timeliness is None:
+            self._timeliness = Timeliness(self.cases, self.signals, self.validate)
+        return self._timeliness.timeliness(time_axis, D, signal_threshold)
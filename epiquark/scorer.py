@@ -1,31 +1,38 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from itertools import product
-from typing import Optional, Union
+from typing import Any, Callable, Iterator, Optional, Union
 
 import numpy as np
 import pandas as pd
 import sklearn.metrics as sk_metrics
 from scipy.stats import multivariate_normal
 
+# Shared by all scores. Threads are only started once the pool is first used.
+_EXECUTOR = ThreadPoolExecutor()
+
 
 class _DataLoader:
     """A class to read, check, and impute data used in this package."""
 
-    def __init__(self, cases: pd.DataFrame, signals: pd.DataFrame) -> None:
+    def __init__(self, cases: pd.DataFrame, signals: pd.DataFrame, validate: bool = True) -> None:
         self.cases = cases
         self.signals = signals
         self.MUST_HAVE_LABELS = {"endemic", "non_case"}
         self.COORDS = self._extract_coords(cases)
-        self.cases = self._prepare_cases(cases)
-        self.signals = self._check_signals_correctness(signals, self.cases)
+        self.cases = self._prepare_cases(cases, validate)
+        if validate:
+            self.signals = self._check_signals_correctness(signals, self.cases)
         self.SIGNALS_LABELS = self.signals["signal_label"].unique()
         self.DATA_LABELS = self.cases["data_label"].unique()
 
     def _extract_coords(self, cases: pd.DataFrame) -> list[str]:
         return list(cases.columns[~cases.columns.isin(["data_label", "value"])])
 
-    def _prepare_cases(self, cases: pd.DataFrame) -> pd.DataFrame:
-        cases_correct = self._check_cases_correctness(cases)
-        return self._impute_non_case(cases_correct)
+    def _prepare_cases(self, cases: pd.DataFrame, validate: bool = True) -> pd.DataFrame:
+        if validate:
+            cases = self._check_cases_correctness(cases)
+        return self._impute_non_case(cases)
 
     def _check_cases_correctness(self, cases: pd.DataFrame) -> pd.DataFrame:
         self._check_no_nans_exist(cases)
@@ -155,15 +162,24 @@ class _DataLoader:
 class _ScoreBase(_DataLoader):
     """Class that contains main logic to calculate p(d_i) and p^(d_i)."""
 
-    def __init__(self, cases, signals) -> None:
-        super().__init__(cases, signals)
+    def __init__(self, cases, signals, validate: bool = True) -> None:
+        super().__init__(cases, signals, validate)
+        self._eval_df_cache: Optional[pd.DataFrame] = None
+        self._d_i_codes: Optional[np.ndarray] = None
+        self._d_i_uniques: Optional[pd.Index] = None
 
     def _eval_df(self) -> pd.DataFrame:
         """Creates DataFrame with p(d_i | x) and p^(d_i | x)"""
-        return self._p_di_given_x().merge(
-            self._p_hat_di(),
-            on=self.COORDS + ["d_i"],
-        )
+        # Only depends on the data, so it is calculated once and copied for each score.
+        if self._eval_df_cache is None:
+            self._eval_df_cache = self._p_di_given_x().merge(
+                self._p_hat_di(),
+                on=self.COORDS + ["d_i"],
+            )
+            # Data labels are factorized once. Scores split the rows by these integer codes
+            # instead of hashing the label strings again.
+            self._d_i_codes, self._d_i_uniques = pd.factorize(self._eval_df_cache["d_i"], sort=True)
+        return self._eval_df_cache.copy()
 
     def _p_hat_di(self) -> pd.DataFrame:
         """Calculates p^(d_i | x) = sum( p(d_i| s_j, x) p(s_j, x) )"""
@@ -234,6 +250,7 @@ class ScoreCalculator(_ScoreBase):
         self,
         cases: pd.DataFrame,
         signals: pd.DataFrame,
+        validate: bool = True,
     ) -> None:
         r"""Builds scorer given data.
 
@@ -257,8 +274,12 @@ class ScoreCalculator(_ScoreBase):
                 where each row is one single cell. Cases coordinates and cells
                 must be subset of cases coordinates and cells. Cells outside
                 the coordinate system of the cases DataFrame are ignored.
+
+            validate: If False, ``cases`` and ``signals`` are not checked for correctness.
+                      Only use this for data that is known to be valid, e.g., because
+                      it was checked before.
         """
-        super().__init__(cases, signals)
+        super().__init__(cases, signals, validate)
 
     def calc_score(
         self,
@@ -269,6 +290,43 @@ class ScoreCalculator(_ScoreBase):
         time_space_weighting: dict[str, float] = None,
         time_axis: Optional[str] = None,
     ) -> dict[str, Union[float, np.ndarray]]:
+        eval_arrays = self._label_arrays(
+            p_thresh, p_hat_thresh, weighting, time_space_weighting, time_axis
+        )
+        return eval_arrays.map(lambda true, pred, weight: scorer(true, pred, sample_weight=weight))
+
+    def _label_arrays(
+        self,
+        p_thresh: Optional[float],
+        p_hat_thresh: Optional[float],
+        weighting: Optional[str],
+        time_space_weighting: Optional[dict[str, float]],
+        time_axis: Optional[str],
+    ) -> "_LabelArrays":
+        eval_df = self._weighted_eval_df(
+            p_thresh, p_hat_thresh, weighting, time_space_weighting, time_axis
+        )
+        # Set by _eval_df, which _weighted_eval_df calls.
+        assert self._d_i_codes is not None and self._d_i_uniques is not None
+        codes, uniques = self._d_i_codes, self._d_i_uniques
+        if len(eval_df) != len(codes):
+            # A weighting merge added rows, e.g., for duplicated cells in unvalidated data.
+            # The cached codes no longer fit the rows.
+            codes, uniques = pd.factorize(eval_df["d_i"], sort=True)
+        return _LabelArrays.from_codes(codes, uniques, eval_df)
+
+    def _weighted_eval_df(
+        self,
+        p_thresh: Optional[float],
+        p_hat_thresh: Optional[float],
+        weighting: Optional[str],
+        time_space_weighting: Optional[dict[str, float]],
+        time_axis: Optional[str],
+    ) -> pd.DataFrame:
+        """Creates DataFrame with (thresholded) ``true``, ``pred`` and ``weight`` per cell.
+
+        The rows are in the same order as in :meth:`_eval_df`.
+        """
         eval_df = self._thresholded_eval_df(p_thresh, p_hat_thresh)
         if weighting is None:
             eval_df["weight"] = 1
@@ -282,20 +340,21 @@ class ScoreCalculator(_ScoreBase):
             eval_df = self._apply_timespace_weighting(eval_df, _time_space_weighting, _time_axis)
         else:
             raise ValueError("weighting must be None, 'cases', or 'timespace'.")
-
-        return (
-            eval_df.groupby("d_i")
-            .apply(lambda x: scorer(x["true"], x["pred"], sample_weight=x["weight"]))
-            .to_dict()
-        )
+        return eval_df
 
     def _apply_case_weighting(self, eval_df: pd.DataFrame) -> pd.DataFrame:
         return eval_df.merge(
-            self.cases, left_on=self.COORDS + ["d_i"], right_on=self.COORDS + ["data_label"]
+            self.cases,
+            left_on=self.COORDS + ["d_i"],
+            right_on=self.COORDS + ["data_label"],
+            how="left",
         ).rename(columns={"value": "weight"})
 
     def _apply_timespace_weighting(self, eval_df, time_space_weighting, time_axis) -> pd.DataFrame:
-        timespaciness = TimeSpaciness(self.cases.query("data_label!='non_case'"), self.signals)
+        # Data was already checked when this instance was built.
+        timespaciness = TimeSpaciness(
+            self.cases.query("data_label!='non_case'"), self.signals, validate=False
+        )
         timespace_weights = timespaciness.timespace_weighting(time_space_weighting, time_axis)
         return eval_df.merge(
             timespace_weights,
@@ -308,26 +367,81 @@ class ScoreCalculator(_ScoreBase):
         self, p_thresh: Optional[float], p_hat_thresh: Optional[float]
     ) -> pd.DataFrame:
         eval_df = self._eval_df()
+        # Binarized labels are stored as uint8, an eighth of the memory of int64.
         # TODO: change to strict larger than.
         # If p_thresh is one p(d_i) is one, label positive anyway
         if p_thresh:
             if p_thresh == 1:
-                eval_df = eval_df.assign(true=np.where(eval_df["p(d_i)"] >= p_thresh, 1, 0))
+                eval_df = eval_df.assign(true=(eval_df["p(d_i)"] >= p_thresh).astype(np.uint8))
             else:
-                eval_df = eval_df.assign(true=np.where(eval_df["p(d_i)"] > p_thresh, 1, 0))
+                eval_df = eval_df.assign(true=(eval_df["p(d_i)"] > p_thresh).astype(np.uint8))
         else:
             eval_df = eval_df.rename(columns={"p(d_i)": "true"})
 
         if p_hat_thresh:
             if p_hat_thresh == 1:
-                eval_df = eval_df.assign(pred=np.where(eval_df["p^(d_i)"] >= p_hat_thresh, 1, 0))
+                eval_df = eval_df.assign(pred=(eval_df["p^(d_i)"] >= p_hat_thresh).astype(np.uint8))
             else:
-                eval_df = eval_df.assign(pred=np.where(eval_df["p^(d_i)"] > p_hat_thresh, 1, 0))
+                eval_df = eval_df.assign(pred=(eval_df["p^(d_i)"] > p_hat_thresh).astype(np.uint8))
         else:
             eval_df = eval_df.rename(columns={"p^(d_i)": "pred"})
         return eval_df
 
 
+@dataclass
+class _LabelArrays:
+    """Columns ``true``, ``pred``, and ``weight`` of an evaluation DataFrame as NumPy arrays.
+
+    The columns are converted once and split per data label, so that scorers get
+    contiguous arrays instead of pandas objects.
+    """
+
+    PARALLEL_MIN_LABELS = 4
+    PARALLEL_MIN_ROWS = 100_000
+
+    labels: list[str]
+    true: list[np.ndarray]
+    pred: list[np.ndarray]
+    weight: list[np.ndarray]
+
+    @classmethod
+    def from_codes(
+        cls, codes: np.ndarray, uniques: pd.Index, eval_df: pd.DataFrame
+    ) -> "_LabelArrays":
+        """Splits ``eval_df`` by ``codes``, the factorized ``d_i`` per row of ``eval_df``."""
+        order = np.argsort(codes, kind="stable")
+        bounds = np.flatnonzero(np.diff(codes[order])) + 1
+
+        def split(col: str) -> list[np.ndarray]:
+            return np.split(eval_df[col].to_numpy()[order], bounds)
+
+        return cls(
+            labels=list(uniques),
+            true=split("true"),
+            pred=split("pred"),
+            weight=split("weight"),
+        )
+
+    def __iter__(self) -> Iterator[tuple[str, np.ndarray, np.ndarray, np.ndarray]]:
+        return zip(self.labels, self.true, self.pred, self.weight)
+
+    def map(self, func: Callable[[np.ndarray, np.ndarray, np.ndarray], Any]) -> dict[str, Any]:
+        """Calls ``func(true, pred, weight)`` per data label.
+
+        Data labels are independent of each other. With at least ``PARALLEL_MIN_LABELS``
+        data labels and ``PARALLEL_MIN_ROWS`` rows in total, they are evaluated in a
+        shared thread pool, as the scorers spend most of their time in NumPy and compiled
+        code. Smaller data is faster to score serially.
+        """
+        if (
+            len(self.labels) < self.PARALLEL_MIN_LABELS
+            or sum(map(len, self.true)) < self.PARALLEL_MIN_ROWS
+        ):
+            return {d_i: func(true, pred, weight) for d_i, true, pred, weight in self}
+        results = _EXECUTOR.map(func, self.true, self.pred, self.weight)
+        return dict(zip(self.labels, results))
+
+
 class TimeSpaciness(_DataLoader):
     """A class to calculate time space accuracy."""
 
@@ -335,6 +449,7 @@ class TimeSpaciness(_DataLoader):
         self,
         cases: pd.DataFrame,
         signals: pd.DataFrame,
+        validate: bool = True,
     ) -> None:
         r"""Builds TimeSpaciness given data.
 
@@ -358,8 +473,12 @@ class TimeSpaciness(_DataLoader):
                 where each row is one single cell. Cases coordinates and cells
                 must be subset of cases coordinates and cells. Cells outside
                 the coordinate system of the cases DataFrame are ignored.
+
+            validate: If False, ``cases`` and ``signals`` are not checked for correctness.
+                      Only use this for data that is known to be valid, e.g., because
+                      it was checked before.
         """
-        super().__init__(cases, signals)
+        super().__init__(cases, signals, validate)
 
     def timespace_weighting(
         self,
@@ -440,6 +559,7 @@ class Timeliness(_DataLoader):
         self,
         cases: pd.DataFrame,
         signals: pd.DataFrame,
+        validate: bool = True,
     ) -> None:
         r"""Builds Timeliness given data.
 
@@ -463,8 +583,12 @@ class Timeliness(_DataLoader):
                 where each row is one single cell. Cases coordinates and cells
                 must be subset of cases coordinates and cells. Cells outside
                 the coordinate system of the cases DataFrame are ignored.
+
+            validate: If False, ``cases`` and ``signals`` are not checked for correctness.
+                      Only use this for data that is known to be valid, e.g., because
+                      it was checked before.
         """
-        super().__init__(cases, signals)
+        super().__init__(cases, signals, validate)
         self.outbreak_labels = list(set(self.DATA_LABELS) - set(["endemic", "non_case"]))
         self.outbreak_signals = list(set(self.SIGNALS_LABELS) - set(["endemic", "non_case"]))
 
@@ -486,27 +610,43 @@ class Timeliness(_DataLoader):
             .groupby([time_axis, "data_label"])
             .agg({"value": "any"})
             .reset_index()
+            .pivot(index="data_label", columns=time_axis, values="value")
         )
 
-        delays_per_label = (
-            cases_agg.merge(
-                signals_agg,
-                suffixes=("_cases", "_signals"),
-                on=time_axis,
-            )
-            .groupby("data_label")
-            .apply(lambda x: self._calc_delay(df=x, D=D))
+        # Only time points present in cases and signals count, like an inner join on time_axis.
+        times = cases_agg.columns.intersection(signals_agg.index)
+        if times.empty:
+            # No outbreak cases, or none at a time with signals.
+            return {}
+        delays = self._delays(
+            cases_agg[times].to_numpy(dtype=bool),
+            signals_agg.loc[times, "value"].to_numpy(dtype=bool),
+            D,
         )
-        return dict((1 - delays_per_label / D))
+        return dict(zip(cases_agg.index, 1 - delays / D))
 
     @staticmethod
     def _calc_delay(df: pd.DataFrame, D: int) -> int:
-        first_case_idx = (df["value_cases"] == 1).argmax()
-        first_signal_idx = (df["value_signals"] == 1).argmax()
-        delay = first_signal_idx - first_case_idx
-        if (df["value_cases"].sum() == 0) or (df["value_signals"].sum() == 0):
-            return D
-        elif not (0 <= delay <= D):
-            return D
-        else:
-            return delay
+        delays = Timeliness._delays(
+            df["value_cases"].to_numpy(dtype=bool)[None, :],
+            df["value_signals"].to_numpy(dtype=bool),
+            D,
+        )
+        return delays[0]
+
+    @staticmethod
+    def _delays(cases: np.ndarray, signals: np.ndarray, D: int) -> np.ndarray:
+        """Calculates the delay between first case and first signal for each row of cases.
+
+        Args:
+            cases: Boolean array of shape (labels, time) which is True where cases occurred.
+            signals: Boolean array of shape (time,) which is True where a signal occurred.
+            D: Maximum allowed delay. Delays that are negative, larger than D, or that cannot
+               be calculated because there is no case or no signal are set to D.
+
+        Returns:
+            Delay per row of cases.
+        """
+        delays = signals.argmax() - cases.argmax(axis=1)
+        undetectable = ~cases.any(axis=1) | (not signals.any())
+        return np.where(undetectable | (delays < 0) | (delays > D), D, delays)
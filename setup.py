@@ -34,6 +34,7 @@ setup(
     python_requires=">=3.9, <4",
     install_requires=["scikit-learn>=0.24.2", "pandas>=1.3.0"],
     extras_require={
+        "fast": ["numba>=0.53"],
         "dev": [
             "black>=21.7",
             "codecov",
@@ -45,7 +46,6 @@ setup(
             "pydata-sphinx-theme>=0.7.1",
             "pytest>=6.2.4",
             "pytest-cov>=2.12.1",
-            "pytest-datadir>=1.3.1",
             "pytest-sugar>=0.9.4",
             "sphinx>=4.2.0",
             "sphinxcontrib-napoleon",
@@ -0,0 +1,16 @@
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+@lru_cache(maxsize=None)
+def _read_csv(name: str) -> pd.DataFrame:
+    return pd.read_csv(DATA_DIR / name)
+
+
+def load_csv(name: str) -> pd.DataFrame:
+    """Reads a CSV file from the test data once and returns a copy that tests may change."""
+    return _read_csv(name).copy()
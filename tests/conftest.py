@@ -4,32 +4,35 @@ import pytest
 
 from epiquark import ScoreCalculator, Timeliness, TimeSpaciness
 
+from ._data import load_csv
+
 
 @pytest.fixture
-def paper_example_dfs(shared_datadir) -> tuple[pd.DataFrame, pd.DataFrame]:
-    cases = pd.read_csv(shared_datadir / "paper_example/cases_long.csv")
-    signals = pd.read_csv(shared_datadir / "paper_example/imputed_signals_long.csv")
+def paper_example_dfs() -> tuple[pd.DataFrame, pd.DataFrame]:
+    cases = load_csv("paper_example/cases_long.csv")
+    signals = load_csv("paper_example/imputed_signals_long.csv")
     return cases, signals
 
 
-@pytest.fixture
-def paper_example_score(shared_datadir) -> ScoreCalculator:
-    cases = pd.read_csv(shared_datadir / "paper_example/cases_long.csv")
-    signals = pd.read_csv(shared_datadir / "paper_example/imputed_signals_long.csv")
+@pytest.fixture(scope="session")
+def paper_example_score() -> ScoreCalculator:
+    cases = load_csv("paper_example/cases_long.csv")
+    signals = load_csv("paper_example/imputed_signals_long.csv")
     return ScoreCalculator(cases, signals)
 
 
+# Not shared across tests: test_time_masking changes the cases of this instance.
 @pytest.fixture
-def paper_example_timespaciness(shared_datadir) -> TimeSpaciness:
-    cases = pd.read_csv(shared_datadir / "paper_example/cases_long.csv")
-    signals = pd.read_csv(shared_datadir / "paper_example/imputed_signals_long.csv")
+def paper_example_timespaciness() -> TimeSpaciness:
+    cases = load_csv("paper_example/cases_long.csv")
+    signals = load_csv("paper_example/imputed_signals_long.csv")
     return TimeSpaciness(cases, signals)
 
 
-@pytest.fixture
-def paper_example_timeliness(shared_datadir) -> Timeliness:
-    cases = pd.read_csv(shared_datadir / "paper_example/cases_long.csv")
-    signals = pd.read_csv(shared_datadir / "paper_example/imputed_signals_long.csv")
+@pytest.fixture(scope="session")
+def paper_example_timeliness() -> Timeliness:
+    cases = load_csv("paper_example/cases_long.csv")
+    signals = load_csv("paper_example/imputed_signals_long.csv")
     return Timeliness(cases, signals)
 
 
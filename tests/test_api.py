@@ -1,9 +1,22 @@
+import warnings
+
 import numpy as np
-import pandas as pd
 import pytest
-
-from epiquark.api import _check_threshs, _ThreshRequired, conf_matrix, score, timeliness
-
+import sklearn.metrics as sk_metrics
+
+from epiquark import (
+    MultiMetricScorer,
+    _kernels,
+    conf_matrix,
+    report,
+    score,
+    score_arrays,
+    score_sweep,
+    timeliness,
+)
+from epiquark.api import _binary_confusion, _check_threshs, _conf_matrix, _ThreshRequired
+
+from ._data import load_csv
 from .conftest import compare_dicts_with_nas
 
 
@@ -43,10 +56,82 @@ def test_thresh_check_func():
         _check_threshs("not a metric", p_thresh=1, p_hat_thresh=0.4)
 
 
-def test_scorer_api_no_weighting(shared_datadir) -> None:
+def test_binary_confusion() -> None:
+    true = np.array([1, 1, 0, 0, 1, 0, 1])
+    pred = np.array([1, 0, 1, 0, 1, 0, 0])
+    weight = np.array([0.5, 2, 1, 0, 3, 1.5, 1])
+    assert _binary_confusion(true, pred) == tuple(sk_metrics.confusion_matrix(true, pred).ravel())
+    assert _binary_confusion(true, pred, weight) == tuple(
+        sk_metrics.confusion_matrix(true, pred, sample_weight=weight).ravel()
+    )
+
+
+def test_numpy_kernels(monkeypatch) -> None:
+    cases = load_csv("paper_example/cases_long.csv")
+    signals = load_csv("paper_example/imputed_signals_long.csv")
+    metrics = ["sensitivity", "precision", "npv", "matthews"]
+    expected = report(cases, signals, metrics, 0.5, 0.2, weighting="cases")
+    expected_unweighted = report(cases, signals, metrics, 1, 0.2)
+
+    for name in ["binary_confusion_unweighted", "binary_confusion_weighted"]:
+        monkeypatch.setattr(_kernels, name, getattr(_kernels, f"numpy_{name}"))
+    monkeypatch.setattr(_kernels, "thresholded_confusion", _kernels.numpy_thresholded_confusion)
+
+    true = np.array([1, 1, 0, 0, 1, 0, 1])
+    pred = np.array([1, 0, 1, 0, 1, 0, 0])
+    weight = np.array([0.5, 2, 1, 0, 3, 1.5, 1])
+    assert _binary_confusion(true, pred) == tuple(sk_metrics.confusion_matrix(true, pred).ravel())
+    assert _binary_confusion(true, pred, weight) == tuple(
+        sk_metrics.confusion_matrix(true, pred, sample_weight=weight).ravel()
+    )
+    compare_dicts_with_nas(report(cases, signals, metrics, 0.5, 0.2, weighting="cases"), expected)
+    compare_dicts_with_nas(report(cases, signals, metrics, 1, 0.2), expected_unweighted)
+
+
+def test_auc_matches_sklearn() -> None:
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        true = np.r_[0, 1, rng.integers(0, 2, 40)]
+        pred = rng.integers(0, 6, 42) / 5
+        weight = rng.random(42)
+        assert score_arrays(true, pred, "auc", p_thresh=0.5) == sk_metrics.roc_auc_score(true, pred)
+        np.testing.assert_allclose(
+            score_arrays(true, pred, "auc", p_thresh=0.5, sample_weight=weight),
+            sk_metrics.roc_auc_score(true, pred, sample_weight=weight),
+            rtol=1e-12,
+        )
+
+
+def test_score_arrays() -> None:
+    p_true = np.array([1.0, 0.8, 0.3, 0.0, 0.6, 0.1, 1.0])
+    p_pred = np.array([0.9, 0.1, 0.7, 0.2, 0.5, 0.0, 0.3])
+    weight = np.array([0.5, 2, 1, 0, 3, 1.5, 1])
+    true = np.where(p_true > 0.5, 1, 0)
+    pred = np.where(p_pred > 0.4, 1, 0)
+    assert score_arrays(p_true, p_pred, "f1", p_thresh=0.5, p_hat_thresh=0.4) == (
+        sk_metrics.f1_score(true, pred)
+    )
+    assert score_arrays(
+        p_true, p_pred, "precision", p_thresh=0.5, p_hat_thresh=0.4, sample_weight=weight
+    ) == sk_metrics.precision_score(true, pred, sample_weight=weight)
+    assert score_arrays(p_true, p_pred, "mse") == sk_metrics.mean_squared_error(p_true, p_pred)
+    with pytest.raises(ValueError, match="requires p_thresh"):
+        score_arrays(p_true, p_pred, "auc")
+
+
+def test_single_class_labels() -> None:
+    p = np.array([0.1, 0.2, 0.3])
+    np.testing.assert_equal(_conf_matrix(p, p, 0.5, 0.5, np.ones(3, dtype=int)), [[3, 0], [0, 0]])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert np.isnan(score_arrays(p, p, "sensitivity", p_thresh=0.5, p_hat_thresh=0.5))
+        assert score_arrays(p, p, "specificity", p_thresh=0.5, p_hat_thresh=0.5) == 1
+
+
+def test_scorer_api_no_weighting() -> None:
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "f1",
         0.5,
         0.2,
@@ -58,29 +143,29 @@ def test_scorer_api_no_weighting(shared_datadir) -> None:
         "two": 0.25,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "sensitivity",
         0.5,
         0.2,
     ) == {"endemic": 0.8, "non_case": 1.0, "one": 1.0, "three": 0.0, "two": 1 / 3}
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "recall",
         0.5,
         0.2,
     ) == {"endemic": 0.8, "non_case": 1.0, "one": 1.0, "three": 0.0, "two": 1 / 3}
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "tpr",
         0.5,
         0.2,
     ) == {"endemic": 0.8, "non_case": 1.0, "one": 1.0, "three": 0.0, "two": 1 / 3}
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "specificity",
         0.5,
         0.2,
@@ -92,8 +177,8 @@ def test_scorer_api_no_weighting(shared_datadir) -> None:
         "two": 0.8181818181818182,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "tnr",
         0.5,
         0.2,
@@ -105,8 +190,8 @@ def test_scorer_api_no_weighting(shared_datadir) -> None:
         "two": 0.8181818181818182,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "matthews",
         0.5,
         0.2,
@@ -118,8 +203,8 @@ def test_scorer_api_no_weighting(shared_datadir) -> None:
         "two": 0.12309149097933272,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "brier",
         0.5,
     ) == {
@@ -130,8 +215,8 @@ def test_scorer_api_no_weighting(shared_datadir) -> None:
         "two": 0.12666666666666665,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "auc",
         0.5,
     ) == {
@@ -142,8 +227,8 @@ def test_scorer_api_no_weighting(shared_datadir) -> None:
         "two": 0.4242424242424242,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "r2",
     ) == {
         "endemic": -0.013702460850111953,
@@ -153,8 +238,8 @@ def test_scorer_api_no_weighting(shared_datadir) -> None:
         "two": -0.17753623188405832,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "mse",
     ) == {
         "endemic": 0.1611111111111111,
@@ -164,8 +249,8 @@ def test_scorer_api_no_weighting(shared_datadir) -> None:
         "two": 0.13,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "mae",
     ) == {
         "endemic": 0.20666666666666664,
@@ -175,8 +260,8 @@ def test_scorer_api_no_weighting(shared_datadir) -> None:
         "two": 0.23333333333333336,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "fpr",
         0.5,
         0.2,
@@ -188,63 +273,63 @@ def test_scorer_api_no_weighting(shared_datadir) -> None:
         "two": 0.18181818181818182,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "fnr",
         0.5,
         0.2,
     ) == {"endemic": 0.2, "non_case": 0.0, "one": 0.0, "three": 1.0, "two": 2 / 3}
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "precision",
         0.5,
         0.2,
     ) == {"endemic": 0.5, "non_case": 1.0, "one": 0.6, "three": 0.0, "two": 0.2}
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "ppv",
         0.5,
         0.2,
     ) == {"endemic": 0.5, "non_case": 1.0, "one": 0.6, "three": 0.0, "two": 0.2}
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "npv",
         0.5,
         0.2,
     ) == {"endemic": 0.9411764705882353, "non_case": 1.0, "one": 1.0, "three": 0.95, "two": 0.9}
 
 
-def test_scorer_api_case_weighting(shared_datadir) -> None:
+def test_scorer_api_case_weighting() -> None:
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "f1",
         0.5,
         0.2,
         weighting="cases",
     ) == {"endemic": 0.8888888888888888, "non_case": 1.0, "one": 1.0, "three": 0.0, "two": 0.5}
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "sensitivity",
         0.5,
         0.2,
         weighting="cases",
     ) == {"endemic": 0.8888888888888888, "non_case": 1.0, "one": 1.0, "three": 0.0, "two": 1 / 3}
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "recall",
         0.5,
         0.2,
         weighting="cases",
     ) == {"endemic": 0.8888888888888888, "non_case": 1.0, "one": 1.0, "three": 0.0, "two": 1 / 3}
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "tpr",
         0.5,
         0.2,
@@ -252,8 +337,8 @@ def test_scorer_api_case_weighting(shared_datadir) -> None:
     ) == {"endemic": 0.8888888888888888, "non_case": 1.0, "one": 1.0, "three": 0.0, "two": 1 / 3}
 
     result = score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "specificity",
         0.5,
         0.2,
@@ -263,8 +348,8 @@ def test_scorer_api_case_weighting(shared_datadir) -> None:
     compare_dicts_with_nas(result, expected)
 
     result = score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "tnr",
         0.5,
         0.2,
@@ -274,16 +359,16 @@ def test_scorer_api_case_weighting(shared_datadir) -> None:
     compare_dicts_with_nas(result, expected)
 
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "matthews",
         0.5,
         0.2,
         weighting="cases",
     ) == {"endemic": -0.1111111111111111, "non_case": 0.0, "one": 0.0, "three": 0.0, "two": 1 / 3}
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "brier",
         0.5,
         weighting="cases",
@@ -296,8 +381,8 @@ def test_scorer_api_case_weighting(shared_datadir) -> None:
     }
 
     result = score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "auc",
         0.5,
         weighting="cases",
@@ -306,8 +391,8 @@ def test_scorer_api_case_weighting(shared_datadir) -> None:
     compare_dicts_with_nas(result, expected)
 
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "r2",
         weighting="cases",
     ) == {
@@ -318,8 +403,8 @@ def test_scorer_api_case_weighting(shared_datadir) -> None:
         "two": -12.629629629629632,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "mse",
         weighting="cases",
     ) == {
@@ -330,8 +415,8 @@ def test_scorer_api_case_weighting(shared_datadir) -> None:
         "two": 0.638888888888889,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "mae",
         weighting="cases",
     ) == {
@@ -342,8 +427,8 @@ def test_scorer_api_case_weighting(shared_datadir) -> None:
         "two": 0.75,
     }
     result = score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "fpr",
         0.5,
         0.2,
@@ -352,16 +437,16 @@ def test_scorer_api_case_weighting(shared_datadir) -> None:
     expected = {"endemic": 1.0, "non_case": np.nan, "one": np.nan, "three": 0.0, "two": 0.0}
     compare_dicts_with_nas(result, expected)
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "fnr",
         0.5,
         0.2,
         weighting="cases",
     ) == {"endemic": 0.1111111111111111, "non_case": 0.0, "one": 0.0, "three": 1.0, "two": 2 / 3}
     result = score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "precision",
         0.5,
         0.2,
@@ -376,8 +461,8 @@ def test_scorer_api_case_weighting(shared_datadir) -> None:
     }
     compare_dicts_with_nas(result, expected)
     result = score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "ppv",
         0.5,
         0.2,
@@ -392,8 +477,8 @@ def test_scorer_api_case_weighting(shared_datadir) -> None:
     }
     compare_dicts_with_nas(result, expected)
     result = score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "npv",
         0.5,
         0.2,
@@ -403,10 +488,10 @@ def test_scorer_api_case_weighting(shared_datadir) -> None:
     compare_dicts_with_nas(result, expected)
 
 
-def test_scorer_api_timespace_weighting(shared_datadir) -> None:
+def test_scorer_api_timespace_weighting() -> None:
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "f1",
         0.5,
         0.2,
@@ -421,8 +506,8 @@ def test_scorer_api_timespace_weighting(shared_datadir) -> None:
         "two": 0.2883980180668917,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "sensitivity",
         0.5,
         0.2,
@@ -437,8 +522,8 @@ def test_scorer_api_timespace_weighting(shared_datadir) -> None:
         "two": 0.33333333333333337,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "recall",
         0.5,
         0.2,
@@ -453,8 +538,8 @@ def test_scorer_api_timespace_weighting(shared_datadir) -> None:
         "two": 0.33333333333333337,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "tpr",
         0.5,
         0.2,
@@ -470,8 +555,8 @@ def test_scorer_api_timespace_weighting(shared_datadir) -> None:
     }
 
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "specificity",
         0.5,
         0.2,
@@ -485,8 +570,8 @@ def test_scorer_api_timespace_weighting(shared_datadir) -> None:
         "two": 0.8181818181818182,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "tnr",
         0.5,
         0.2,
@@ -501,8 +586,8 @@ def test_scorer_api_timespace_weighting(shared_datadir) -> None:
     }
 
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "matthews",
         0.5,
         0.2,
@@ -517,8 +602,8 @@ def test_scorer_api_timespace_weighting(shared_datadir) -> None:
         "two": 0.14727817191256395,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "brier",
         0.5,
         weighting="timespace",
@@ -533,8 +618,8 @@ def test_scorer_api_timespace_weighting(shared_datadir) -> None:
     }
 
     result = score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "auc",
         0.5,
         weighting="timespace",
@@ -551,8 +636,8 @@ def test_scorer_api_timespace_weighting(shared_datadir) -> None:
     compare_dicts_with_nas(result, expected)
 
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "r2",
         weighting="timespace",
         time_space_weighting={"x1": 1},
@@ -565,8 +650,8 @@ def test_scorer_api_timespace_weighting(shared_datadir) -> None:
         "two": -0.16042389293765646,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "mse",
         weighting="timespace",
         time_space_weighting={"x1": 1},
@@ -579,8 +664,8 @@ def test_scorer_api_timespace_weighting(shared_datadir) -> None:
         "two": 0.15106763035595444,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "mae",
         weighting="timespace",
         time_space_weighting={"x1": 1},
@@ -593,8 +678,8 @@ def test_scorer_api_timespace_weighting(shared_datadir) -> None:
         "two": 0.2518907794255543,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "fpr",
         0.5,
         0.2,
@@ -608,8 +693,8 @@ def test_scorer_api_timespace_weighting(shared_datadir) -> None:
         "two": 0.18181818181818182,
     }
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "fnr",
         0.5,
         0.2,
@@ -617,8 +702,8 @@ def test_scorer_api_timespace_weighting(shared_datadir) -> None:
         time_axis="x2",
     ) == {"endemic": 0.2, "non_case": 0.0, "one": 0.0, "three": 1.0, "two": 0.6666666666666666}
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "precision",
         0.5,
         0.2,
@@ -626,8 +711,8 @@ def test_scorer_api_timespace_weighting(shared_datadir) -> None:
         time_axis="x2",
     ) == {"endemic": 0.5, "non_case": 1.0, "one": 0.6, "three": 0.0, "two": 0.2}
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "ppv",
         0.5,
         0.2,
@@ -635,8 +720,8 @@ def test_scorer_api_timespace_weighting(shared_datadir) -> None:
         time_axis="x2",
     ) == {"endemic": 0.5, "non_case": 1.0, "one": 0.6, "three": 0.0, "two": 0.2}
     assert score(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "npv",
         0.5,
         0.2,
@@ -645,20 +730,42 @@ def test_scorer_api_timespace_weighting(shared_datadir) -> None:
     ) == {"endemic": 0.9411764705882353, "non_case": 1.0, "one": 1.0, "three": 0.95, "two": 0.9}
 
 
-def test_scorer_api_errors(shared_datadir) -> None:
+def test_scorer_api_errors() -> None:
     with pytest.raises(ValueError, match="weighting must be None, 'cases', or 'timespace'."):
         assert score(
-            pd.read_csv("tests/data/paper_example/cases_long.csv"),
-            pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+            load_csv("paper_example/cases_long.csv"),
+            load_csv("paper_example/imputed_signals_long.csv"),
             "mse",
             weighting="not a weighting strategy",
         )
 
 
-def test_conf_matrix_api(shared_datadir) -> None:
+def test_score_sweep_api() -> None:
+    cases = load_csv("paper_example/cases_long.csv")
+    signals = load_csv("paper_example/imputed_signals_long.csv")
+    thresholds_true = [0.5, 1]
+    thresholds_pred = [0, 0.2, 0.5, 1]
+    for weighting in [None, "cases"]:
+        for metric in ["sensitivity", "specificity", "fpr", "fnr", "precision", "npv"]:
+            result = score_sweep(
+                cases, signals, metric, thresholds_true, thresholds_pred, weighting=weighting
+            )
+            for i, p_thresh in enumerate(thresholds_true):
+                for j, p_hat_thresh in enumerate(thresholds_pred):
+                    expected = score(
+                        cases, signals, metric, p_thresh, p_hat_thresh, weighting=weighting
+                    )
+                    for data_label, value in expected.items():
+                        np.testing.assert_allclose(result[data_label][i, j], value)
+
+    with pytest.raises(KeyError):
+        score_sweep(cases, signals, "auc", [0.5], [0.2])
+
+
+def test_conf_matrix_api() -> None:
     confusion_matrix = conf_matrix(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         0.5,
         0.2,
     )
@@ -674,10 +781,59 @@ def test_conf_matrix_api(shared_datadir) -> None:
     np.testing.assert_equal(confusion_matrix, expected)
 
 
+def test_multi_metric_scorer() -> None:
+    cases = load_csv("paper_example/cases_long.csv")
+    signals = load_csv("paper_example/imputed_signals_long.csv")
+    scorer = MultiMetricScorer(cases, signals)
+
+    assert scorer.score("f1", 0.5, 0.2) == score(cases, signals, "f1", 0.5, 0.2)
+    assert scorer.score("auc", 0.5) == score(cases, signals, "auc", 0.5)
+    assert scorer.score("mse", weighting="cases") == score(cases, signals, "mse", weighting="cases")
+    np.testing.assert_equal(scorer.conf_matrix(0.5, 0.2), conf_matrix(cases, signals, 0.5, 0.2))
+    assert scorer.timeliness("x2", 2) == timeliness(cases, signals, "x2", 2)
+
+    f1 = scorer.score("f1", 0.5, 0.2)
+    f1["endemic"] = None
+    assert scorer.score("f1", 0.5, 0.2) == score(cases, signals, "f1", 0.5, 0.2)
+
+    with pytest.raises(
+        ValueError, match="This metric requires p_thresh and requires p_hat_thresh."
+    ):
+        scorer.score("f1", 0.5)
+
+
+def test_report_api() -> None:
+    cases = load_csv("paper_example/cases_long.csv")
+    signals = load_csv("paper_example/imputed_signals_long.csv")
+    scores = report(cases, signals, ["f1", "brier", "mse"], 0.5, 0.2, weighting="cases")
+
+    assert scores == {
+        "f1": score(cases, signals, "f1", 0.5, 0.2, weighting="cases"),
+        "brier": score(cases, signals, "brier", 0.5, weighting="cases"),
+        "mse": score(cases, signals, "mse", weighting="cases"),
+    }
+
+
+def test_uncachable_weighting() -> None:
+    cases = load_csv("paper_example/cases_long.csv")
+    signals = load_csv("paper_example/imputed_signals_long.csv")
+    scorer = MultiMetricScorer(cases, signals)
+
+    with pytest.raises(ValueError, match="weighting must be None, 'cases', or 'timespace'."):
+        scorer.score("f1", 0.5, 0.2, weighting=np.ones(len(cases)))
+    with pytest.raises(ValueError, match="weighting must be None, 'cases', or 'timespace'."):
+        scorer.conf_matrix(0.5, 0.2, weighting=np.ones(len(cases)))
+    # time_space_weighting is ignored without timespace weighting, even if it is not hashable.
+    unhashable = {"x1": [1]}
+    assert scorer.score(
+        "f1", 0.5, 0.2, time_space_weighting=unhashable  # type: ignore
+    ) == scorer.score("f1", 0.5, 0.2)
+
+
 def test_timeliness_api():
     output = timeliness(
-        pd.read_csv("tests/data/paper_example/cases_long.csv"),
-        pd.read_csv("tests/data/paper_example/imputed_signals_long.csv"),
+        load_csv("paper_example/cases_long.csv"),
+        load_csv("paper_example/imputed_signals_long.csv"),
         "x2",
         2,
     )
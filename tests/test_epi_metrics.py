@@ -3,6 +3,8 @@ import pytest
 
 from epiquark import Timeliness, TimeSpaciness
 
+from ._data import load_csv
+
 
 def test_timeliness(paper_example_timeliness: Timeliness) -> None:
     timeliness = paper_example_timeliness.timeliness("x2", 4)
@@ -10,6 +12,12 @@ def test_timeliness(paper_example_timeliness: Timeliness) -> None:
     timeliness == timeliness_expected
 
 
+def test_timeliness_without_outbreaks() -> None:
+    cases = load_csv("paper_example/cases_long.csv").query("data_label == 'endemic'")
+    signals = load_csv("paper_example/imputed_signals_long.csv")
+    assert Timeliness(cases, signals).timeliness("x2", 4) == {}
+
+
 def test_timeliness_type_check(paper_example_timeliness: Timeliness) -> None:
     with pytest.raises(ValueError, match="time_axis must be of type str."):
         paper_example_timeliness.timeliness(2, 4)  # type: ignore
@@ -53,29 +61,29 @@ def test_calc_delay() -> None:
     assert 0 == Timeliness._calc_delay(delay_0, 3)
 
 
-def test_time_masking(shared_datadir, paper_example_timespaciness: TimeSpaciness) -> None:
+def test_time_masking(paper_example_timespaciness: TimeSpaciness) -> None:
     time_mask = paper_example_timespaciness._time_mask("x2").reset_index(drop=True)
-    expected = pd.read_csv(shared_datadir / "paper_example/time_masking.csv")
+    expected = load_csv("paper_example/time_masking.csv")
     pd.testing.assert_frame_equal(time_mask, expected)
 
     # case where no cases appear on one label
     cases = paper_example_timespaciness.cases
     cases.loc[cases["data_label"] == "one", "value"] = 0
     time_mask = paper_example_timespaciness._time_mask("x2").reset_index(drop=True)
-    expected = pd.read_csv(shared_datadir / "paper_example/time_masking.csv")
+    expected = load_csv("paper_example/time_masking.csv")
     expected.loc[expected["data_label"] == "one", "time_mask"] = 0
     pd.testing.assert_frame_equal(time_mask, expected)
 
 
-def test_timespace_weighting(shared_datadir, paper_example_timespaciness: TimeSpaciness) -> None:
+def test_timespace_weighting(paper_example_timespaciness: TimeSpaciness) -> None:
     gauss_weights = paper_example_timespaciness.timespace_weighting(
         time_space_weighting={"x1": 1, "x2": 1},
     )
-    expected = pd.read_csv(shared_datadir / "paper_example/gauss_weights.csv")
+    expected = load_csv("paper_example/gauss_weights.csv")
     pd.testing.assert_frame_equal(gauss_weights, expected)
 
     gauss_weights = paper_example_timespaciness.timespace_weighting(
         {"x1": 1, "x2": 1}, time_axis="x2"
     )
-    expected = pd.read_csv(shared_datadir / "paper_example/gauss_weights_timemask.csv")
+    expected = load_csv("paper_example/gauss_weights_timemask.csv")
     pd.testing.assert_frame_equal(gauss_weights, expected)
@@ -4,31 +4,34 @@ import pytest
 from sklearn import metrics
 
 from epiquark import ScoreCalculator
+from epiquark.scorer import _LabelArrays
 
+from ._data import load_csv
 
-def test_non_case_imputation(shared_datadir, paper_example_score: ScoreCalculator) -> None:
-    cases = pd.read_csv(shared_datadir / "paper_example/cases_long.csv")
+
+def test_non_case_imputation(paper_example_score: ScoreCalculator) -> None:
+    cases = load_csv("paper_example/cases_long.csv")
     imputed = paper_example_score._impute_non_case(cases)
 
-    imputed_expected = pd.read_csv(shared_datadir / "paper_example/non_case_imputed_long.csv")
+    imputed_expected = load_csv("paper_example/non_case_imputed_long.csv")
     pd.testing.assert_frame_equal(imputed, imputed_expected, check_dtype=False)
 
 
-def test_p_di_given_x(shared_datadir, paper_example_score: ScoreCalculator) -> None:
+def test_p_di_given_x(paper_example_score: ScoreCalculator) -> None:
     p_di_given_x = paper_example_score._p_di_given_x()
-    p_di_given_x_expected = pd.read_csv(shared_datadir / "paper_example/p_di_given_x.csv")
+    p_di_given_x_expected = load_csv("paper_example/p_di_given_x.csv")
     pd.testing.assert_frame_equal(p_di_given_x, p_di_given_x_expected, check_dtype=False)
 
 
-def test_p_sj_given_x(shared_datadir, paper_example_score: ScoreCalculator) -> None:
+def test_p_sj_given_x(paper_example_score: ScoreCalculator) -> None:
     p_sj_given_x = paper_example_score._p_sj_given_x()
-    p_sj_given_x_expected = pd.read_csv(shared_datadir / "paper_example/p_sj_given_x_long.csv")
+    p_sj_given_x_expected = load_csv("paper_example/p_sj_given_x_long.csv")
     pd.testing.assert_frame_equal(p_sj_given_x, p_sj_given_x_expected, check_dtype=False)
 
 
-def test_p_di_given_sj(shared_datadir, paper_example_score: ScoreCalculator) -> None:
+def test_p_di_given_sj(paper_example_score: ScoreCalculator) -> None:
     p_di_given_sj_x = paper_example_score._p_di_given_sj()
-    p_di_given_sj_x_expected = pd.read_csv(shared_datadir / "paper_example/p_di_given_sj.csv")
+    p_di_given_sj_x_expected = load_csv("paper_example/p_di_given_sj.csv")
     str_cols = list(p_di_given_sj_x.select_dtypes(exclude="number").columns)
     pd.testing.assert_frame_equal(
         p_di_given_sj_x.sort_values(by=str_cols).reset_index(drop=True),
@@ -37,12 +40,12 @@ def test_p_di_given_sj(shared_datadir, paper_example_score: ScoreCalculator) ->
     )
 
 
-def test_p_hat_di(shared_datadir, paper_example_score: ScoreCalculator) -> None:
+def test_p_hat_di(paper_example_score: ScoreCalculator) -> None:
     p_hat_di = (
         paper_example_score._p_hat_di().sort_values(by=["x1", "x2", "d_i"]).reset_index(drop=True)
     )
     p_hat_di_expected = (
-        pd.read_csv(shared_datadir / "paper_example/p_hat_di.csv")
+        load_csv("paper_example/p_hat_di.csv")
         .sort_values(by=["x1", "x2", "d_i"])
         .reset_index(drop=True)
     )
@@ -53,9 +56,9 @@ def test_p_hat_di(shared_datadir, paper_example_score: ScoreCalculator) -> None:
     )
 
 
-def test_eval_df(shared_datadir, paper_example_score: ScoreCalculator) -> None:
+def test_eval_df(paper_example_score: ScoreCalculator) -> None:
     eval_df = paper_example_score._eval_df()
-    eval_df_expected = pd.read_csv(shared_datadir / "paper_example/eval_df.csv")
+    eval_df_expected = load_csv("paper_example/eval_df.csv")
     pd.testing.assert_frame_equal(eval_df, eval_df_expected, check_dtype=False)
 
 
@@ -92,6 +95,42 @@ def test_check_cases_pos_ints(paper_example_dfs) -> None:
         ScoreCalculator(cases_float, signals)
 
 
+def test_skip_validation(paper_example_dfs) -> None:
+    cases, signals = paper_example_dfs
+
+    cases_negative = cases.copy()
+    cases_negative.at[2, "value"] = -1
+    ScoreCalculator(cases_negative, signals, validate=False)
+
+    scores = ScoreCalculator(cases, signals, validate=False).calc_score(
+        metrics.f1_score, 1 / 2, 1 / 5
+    )
+    assert scores == ScoreCalculator(cases, signals).calc_score(metrics.f1_score, 1 / 2, 1 / 5)
+
+
+def test_calc_score_parallel(paper_example_score: ScoreCalculator, monkeypatch) -> None:
+    monkeypatch.setattr(_LabelArrays, "PARALLEL_MIN_ROWS", 0)
+    parallel = paper_example_score.calc_score(metrics.f1_score, 1 / 2, 1 / 5, weighting="cases")
+    monkeypatch.setattr(_LabelArrays, "PARALLEL_MIN_LABELS", np.inf)
+    serial = paper_example_score.calc_score(metrics.f1_score, 1 / 2, 1 / 5, weighting="cases")
+    assert list(parallel) == list(serial)
+    assert parallel == serial
+
+
+def test_calc_score_duplicated_cells(paper_example_dfs) -> None:
+    cases, signals = paper_example_dfs
+    duplicated = pd.concat([cases, cases.iloc[:3]], ignore_index=True)
+    calculator = ScoreCalculator(duplicated, signals, validate=False)
+
+    scores = calculator.calc_score(metrics.f1_score, 1 / 2, 1 / 5, weighting="cases")
+    eval_df = calculator._weighted_eval_df(1 / 2, 1 / 5, "cases", None, None)
+    expected = {
+        d_i: metrics.f1_score(df["true"], df["pred"], sample_weight=df["weight"])
+        for d_i, df in eval_df.groupby("d_i")
+    }
+    assert scores == expected
+
+
 def test_check_non_cases_not_include(paper_example_dfs) -> None:
     cases, signals = paper_example_dfs
 